@@ -1,8 +1,10 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import sys
 import smtplib
 from email.mime.multipart import MIMEMultipart
@@ -29,6 +31,9 @@ RESUME_PATH = Path(__file__).parent / "Nilesh Pataskar Resume.pdf"
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w.-]+\.\w+", re.ASCII)
+_TO_PLACEHOLDER = b"__TO__"
+
 # ---------------------------------------------------------------------------
 # Email Content
 # ---------------------------------------------------------------------------
@@ -55,10 +60,81 @@ Nilesh Pataskar
 """
 
 
+def normalize_email(address: str) -> str | None:
+    """
+    Lowercase an address and punycode its domain.
+
+    Returns None if the result is not a well-formed address, so bad input
+    is caught before an SMTP connection is opened.
+    """
+
+    local, sep, domain = address.strip().lower().rpartition("@")
+    if not sep:
+        return None
+    try:
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+
+    normalized = f"{local}@{domain}"
+    if not _EMAIL_RE.fullmatch(normalized):
+        return None
+    return normalized
+
+
+def _resume_attachment() -> MIMEBase:
+    """Build the base64-encoded resume attachment."""
+
+    attachment = MIMEBase("application", "pdf")
+    attachment.set_payload(RESUME_PATH.read_bytes())
+    encoders.encode_base64(attachment)
+    attachment.add_header(
+        "Content-Disposition",
+        f"attachment; filename={RESUME_PATH.name}",
+    )
+    return attachment
+
+
+@functools.lru_cache(maxsize=1)
+def _message_template() -> bytes:
+    """
+    Render the application email once, with a placeholder in the To header.
+
+    Subject, body and resume are identical for every recipient, so only the
+    To header needs to be swapped in before sending. The bytes use CRLF line
+    endings because SMTP.sendmail sends bytes to the wire unchanged.
+    """
+
+    msg = MIMEMultipart()
+    msg["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
+    msg["To"] = _TO_PLACEHOLDER.decode("ascii")
+    msg["Subject"] = SUBJECT
+
+    msg.attach(MIMEText(EMAIL_BODY, "plain"))
+
+    msg.attach(_resume_attachment())
+
+    return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+
+
+def _start_session(server: smtplib.SMTP, app_password: str) -> None:
+    """Greet, upgrade to TLS and authenticate on a freshly connected socket."""
+
+    # Explicit EHLO: after a reconnect smtplib would otherwise reuse the
+    # previous session's post-TLS features, which lack STARTTLS.
+    server.ehlo()
+    server.starttls()
+    server.login(SENDER_EMAIL, app_password)
+
+
 def send_application_email(recipient: str) -> None:
     """
     Send an application email with resume attached.
 
+    If the connection drops during the send, it reconnects and resends once.
+    The server may already have accepted the message before dropping, so in
+    that case the recipient can receive it twice.
+
     Parameters
     ----------
     recipient : str
@@ -77,29 +153,29 @@ def send_application_email(recipient: str) -> None:
         print(f"Error: Resume not found at {RESUME_PATH}", file=sys.stderr)
         sys.exit(1)
 
-    msg = MIMEMultipart()
-    msg["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
-    msg["To"] = recipient
-    msg["Subject"] = SUBJECT
+    address = normalize_email(recipient)
+    if not address:
+        print(f"Error: Invalid recipient address: {recipient}", file=sys.stderr)
+        sys.exit(1)
+    recipient = address
 
-    msg.attach(MIMEText(EMAIL_BODY, "plain"))
-
-    with open(RESUME_PATH, "rb") as f:
-        attachment = MIMEBase("application", "pdf")
-        attachment.set_payload(f.read())
-        encoders.encode_base64(attachment)
-        attachment.add_header(
-            "Content-Disposition",
-            f"attachment; filename={RESUME_PATH.name}",
-        )
-        msg.attach(attachment)
+    payload = _message_template().replace(
+        _TO_PLACEHOLDER, recipient.encode("ascii"), 1
+    )
 
     try:
         print(f"Connecting to {SMTP_SERVER}...")
         with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, app_password)
-            server.send_message(msg)
+            _start_session(server, app_password)
+            try:
+                server.sendmail(SENDER_EMAIL, [recipient], payload)
+            except smtplib.SMTPServerDisconnected:
+                # smtplib reports any socket error mid-session this way.
+                print("Connection dropped, reconnecting once...")
+                server.close()
+                server.connect(SMTP_SERVER, SMTP_PORT)
+                _start_session(server, app_password)
+                server.sendmail(SENDER_EMAIL, [recipient], payload)
         print(f"✅ Email sent successfully to {recipient}")
     except smtplib.SMTPAuthenticationError:
         print(
@@ -110,6 +186,10 @@ def send_application_email(recipient: str) -> None:
     except smtplib.SMTPException as exc:
         print(f"SMTP error: {exc}", file=sys.stderr)
         sys.exit(1)
+    except OSError as exc:
+        # Refused, DNS and timeout errors from connect() are not SMTPExceptions.
+        print(f"Error: Could not connect to {SMTP_SERVER}: {exc}", file=sys.stderr)
+        sys.exit(1)
 
 
 def main() -> None:
@@ -133,6 +213,14 @@ def main() -> None:
         print("Error: Could not extract founder info.", file=sys.stderr)
         sys.exit(1)
 
+    recipient = normalize_email(recipient)
+    if not recipient:
+        print(
+            f"Error: Extracted email is not valid: {result.get('email')}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     print(f"   Found: {founder_name}")
     print(f"   Email: {recipient}")
     print()
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import json
 import os
+import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from openai import OpenAI, OpenAIError
@@ -22,34 +32,120 @@ UNRAVEL_URLS = [
     "https://unravel.tech/talks",
 ]
 
+CACHE_DIR = Path.home() / ".cache" / "unravel"
+SCRAPE_CACHE_TTL = 60 * 60  # seconds
 
-def scrape_unravel_profiles() -> str:
-    """
-    Scrape unravel.tech pages to gather text content about founders and team.
-    Returns the combined text from all pages for the LLM to analyze.
+
+def _cache_path(prefix: str, key: str, suffix: str) -> Path:
+    """Content-addressed cache file for ``key``."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{prefix}-{digest}{suffix}"
+
+
+def _read_cache(path: Path, ttl: float | None = None) -> str | None:
+    """Return cached text, or None if missing or older than ``ttl`` seconds."""
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_cache(path: Path, text: str) -> None:
     """
-    all_text = []
+    Best-effort cache write; a read-only home directory is not an error.
 
-    for url in UNRAVEL_URLS:
+    Writes to a temp file and renames it over ``path`` so concurrent
+    readers never see a partially written entry.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as exc:
+        print(f"Warning: Could not write cache {path}: {exc}", file=sys.stderr)
+
+
+# Prefer the C-backed lxml tree builder, but keep working without it.
+try:
+    import lxml  # noqa: F401
 
-            # Remove script and style tags
-            for tag in soup(["script", "style", "noscript"]):
-                tag.decompose()
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
-            text = soup.get_text(separator="\n", strip=True)
-            all_text.append(f"--- Content from {url} ---\n{text}")
-        except requests.RequestException as exc:
-            print(f"Warning: Could not fetch {url}: {exc}", file=sys.stderr)
+# Shared keep-alive session so concurrent fetches reuse TCP/TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
-    if not all_text:
+
+def _fetch_page_text(url: str) -> str | None:
+    """Fetch a single page and return its visible text, or None on failure."""
+    try:
+        resp = _SESSION.get(url, timeout=10)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        print(f"Warning: Could not fetch {url}: {exc}", file=sys.stderr)
+        return None
+
+    # Hand bs4 the raw bytes. It sniffs the encoding itself unless the
+    # Content-Type header declares a charset, which takes precedence.
+    content_type = Message()
+    content_type["Content-Type"] = resp.headers.get("Content-Type", "")
+    soup = BeautifulSoup(
+        resp.content,
+        HTML_PARSER,
+        from_encoding=content_type.get_content_charset(),
+    )
+
+    # Remove script and style tags
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+
+    return soup.get_text(separator="\n", strip=True)
+
+
+@functools.lru_cache(maxsize=1)
+def scrape_unravel_profiles() -> str:
+    """
+    Scrape unravel.tech pages to gather text content about founders and team.
+    Returns the combined text from all pages for the LLM to analyze.
+    Pages are fetched concurrently; output keeps the order of UNRAVEL_URLS.
+    Complete results are cached on disk for SCRAPE_CACHE_TTL seconds.
+    """
+    cache_path = _cache_path("scrape", ",".join(UNRAVEL_URLS), ".txt")
+    cached = _read_cache(cache_path, ttl=SCRAPE_CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    with ThreadPoolExecutor(max_workers=len(UNRAVEL_URLS)) as executor:
+        pages = list(executor.map(_fetch_page_text, UNRAVEL_URLS))
+
+    buf = io.StringIO()
+    for url, text in zip(UNRAVEL_URLS, pages):
+        if text is None:
+            continue
+        if buf.tell():
+            buf.write("\n\n")
+        buf.write(f"--- Content from {url} ---\n")
+        buf.write(text)
+
+    if not buf.tell():
         print("Error: Could not fetch any content from unravel.tech", file=sys.stderr)
         sys.exit(1)
 
-    return "\n\n".join(all_text)
+    profiles = buf.getvalue()
+    # Don't freeze a partial scrape into the cache after a transient failure.
+    if None not in pages:
+        _write_cache(cache_path, profiles)
+    return profiles
 
 
 # ---------------------------------------------------------------------------
@@ -84,16 +180,126 @@ IMPORTANT: Return ONLY the raw JSON. No markdown, no explanation.
 """
 
 
+_ROLE = r"(?i:co-?founder|founder)"
+_ROLE_TAIL = _ROLE + r"(?:[ \t]*&[ \t]*\w+)?"  # "Co-founder & CTO"
+_FULL_NAME = r"\b([A-Z][a-z]+)[ \t]+([A-Z][a-z]+)\b"
+_ROLE_RE = re.compile(_ROLE)
+# Both patterns must span a whole line. That keeps titles such as
+# "Product Engineering: Founder Mode" and a role line followed by the
+# next person's name from being read as a founder.
+_FOUNDER_PATTERNS = (
+    # "Co-founder: Jane Doe"
+    re.compile(
+        r"^[ \t]*" + _ROLE + r"[ \t]*:?[ \t]*" + _FULL_NAME + r"[ \t]*$", re.M
+    ),
+    # "Jane Doe, Co-founder & CTO", "Jane Doe - Founder", "Jane Doe (Founder)"
+    re.compile(
+        r"^[ \t]*"
+        + _FULL_NAME
+        + r"(?:(?:[ \t]*,[ \t]*|[ \t]+-[ \t]+)"
+        + _ROLE_TAIL
+        + r"|[ \t]*\([ \t]*"
+        + _ROLE_TAIL
+        + r"[ \t]*\))[ \t]*$",
+        re.M,
+    ),
+)
+_NEXT_WORD_RE = re.compile(r"[ \t]+([A-Z][a-z]+)")
+
+# Characters of context kept around each founder mention in the prompt.
+FOUNDER_CONTEXT_BEFORE = 200
+FOUNDER_CONTEXT_AFTER = 400
+
+
+def _founder_snippets(profiles: str) -> str:
+    """
+    Keep only the text surrounding founder mentions, merging overlaps.
+
+    Falls back to the full text when "founder" never appears.
+    """
+    spans: list[list[int]] = []
+    for m in _ROLE_RE.finditer(profiles):
+        start = max(0, m.start() - FOUNDER_CONTEXT_BEFORE)
+        end = min(len(profiles), m.end() + FOUNDER_CONTEXT_AFTER)
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+
+    if not spans:
+        return profiles
+    return "\n...\n".join(profiles[start:end] for start, end in spans)
+
+
 def build_user_prompt(profiles: str) -> str:
-    """Construct the user message that carries the scraped content."""
-    return f"Scraped content from unravel.tech:\n\n{profiles}"
+    """Construct the user message that carries the founder-related content."""
+    return f"Scraped content from unravel.tech:\n\n{_founder_snippets(profiles)}"
+
+
+def _mentioned_elsewhere(
+    profiles: str, first: str, last: str, span: tuple[int, int]
+) -> bool:
+    """
+    Check that ``first`` also appears outside ``span`` as a person's name.
+
+    A mention counts when it is not followed by another capitalised word,
+    or is followed by ``last``; "Product Strategy" does not vouch for
+    "Product Manager".
+    """
+    for m in re.finditer(rf"\b{re.escape(first)}\b", profiles):
+        if span[0] <= m.start() < span[1]:
+            continue
+        next_word = _NEXT_WORD_RE.match(profiles, m.end())
+        if next_word is None or next_word.group(1) == last:
+            return True
+    return False
+
+
+def _fast_find_founder(profiles: str) -> dict[str, Any] | None:
+    """
+    Apply the system prompt's matching rule directly to the scraped text.
+
+    Only a whole line binding a name to a founder role counts, and the first
+    name must be mentioned elsewhere on the page too. Returns None when no
+    founder, or more than one distinct founder, matches so the caller can
+    fall back to the LLM.
+    """
+    matches = {
+        (m.group(1), m.group(2))
+        for pattern in _FOUNDER_PATTERNS
+        for m in pattern.finditer(profiles)
+        if SEARCH_SUBSTRING in m.group(1).lower()
+        and _mentioned_elsewhere(profiles, m.group(1), m.group(2), m.span())
+    }
+    if len(matches) != 1:
+        return None
+
+    first, last = matches.pop()
+    return {"founder_name": f"{first} {last}", "email": f"{first.lower()}@unrel.tech"}
 
 
+@functools.lru_cache(maxsize=8)
 def extract_founder_info(profiles: str) -> dict[str, Any]:
     """
     Call the LLM to extract founder information from scraped web content.
+    Responses are cached on disk, keyed on the model and full prompt.
+    The LLM is skipped entirely when a plain text match finds the founder.
     """
 
+    fast_result = _fast_find_founder(profiles)
+    if fast_result is not None:
+        return fast_result
+
+    cache_path = _cache_path(
+        "llm", MODEL + SYSTEM_PROMPT + build_user_prompt(profiles), ".json"
+    )
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        try:
+            return json.loads(cached)
+        except json.JSONDecodeError:
+            pass
+
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         print(
@@ -136,6 +342,7 @@ def extract_founder_info(profiles: str) -> dict[str, Any]:
         )
         sys.exit(1)
 
+    _write_cache(cache_path, raw_content)
     return result
 
 def main() -> None: